@@ -24,10 +24,25 @@ class EstimationTask:
             e.g. number of shots or target accuracy.
     """
 
+    # Slots are declared manually, as dataclass(slots=True) requires Python 3.10.
+    __slots__ = ("operator", "circuit", "number_of_shots")
+
     operator: PauliRepresentation
     circuit: Circuit
     number_of_shots: Optional[int]
 
+    # Frozen dataclasses with slots cannot be unpickled or copied using the default
+    # protocol, because it restores the state by setting attributes.
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        # Tasks pickled before slots were declared carry their __dict__ as state.
+        if isinstance(state, dict):
+            state = tuple(state[name] for name in self.__slots__)
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 class EstimationPreprocessor(Protocol):
     """Protocol defining function which transforms a list of EstimationTasks
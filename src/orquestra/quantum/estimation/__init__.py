@@ -6,5 +6,6 @@ from ._estimation import (
     estimate_expectation_values_by_averaging,
     evaluate_estimation_circuits,
     evaluate_non_measured_estimation_tasks,
+    split_estimation_tasks_into_qwc_frames,
     split_estimation_tasks_to_measure,
 )
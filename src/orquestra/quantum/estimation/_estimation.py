@@ -1,14 +1,84 @@
 ################################################################################
 # © Copyright 2021-2022 Zapata Computing Inc.
 ################################################################################
-from typing import Dict, List, Optional, Tuple, cast
+import copy
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+from numbers import Number
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, cast
 
 import numpy as np
 import sympy
 
 from ..api.backend import QuantumBackend, QuantumSimulator
 from ..api.estimation import EstimationTask
+from ..circuits import RX, Circuit, H, Operation
 from ..measurements import ExpectationValues, expectation_values_to_real
+from ..operators import PauliRepresentation, PauliSum, PauliTerm, group_qwc
+from ..typing import Parameter
+
+# Number of recently computed (circuit, operator) pairs for which exact expectation
+# values are reused. Lookup is a linear scan by identity, hence the cache is small.
+EXACT_EXPECTATION_VALUES_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(
+    expression: sympy.Expr,
+) -> Tuple[Tuple[sympy.Symbol, ...], Callable[..., float]]:
+    """Compile sympy expression into a plain Python callable.
+
+    The order of symbols is fixed at compile time and returned together with the
+    callable, so that it can be invoked positionally with the symbols' values.
+    Functions not available in math module (e.g. Max or Heaviside) are evaluated
+    with sympy. Symbols are replaced with dummy arguments, so that distinct symbols
+    sharing a name do not collide, nor shadow names from math module.
+    """
+    symbols = tuple(sorted(expression.free_symbols, key=str))
+    return symbols, sympy.lambdify(
+        symbols, expression, modules=["math", "sympy"], dummify=True
+    )
+
+
+def _bind_parameter(
+    parameter: Parameter, symbols_map: Dict[sympy.Symbol, Any]
+) -> Parameter:
+    if not isinstance(parameter, sympy.Expr) or not parameter.free_symbols:
+        return parameter
+
+    # Bare symbols are the most common parameters and need no compilation at all.
+    if isinstance(parameter, sympy.Symbol):
+        return symbols_map.get(parameter, parameter)
+
+    symbols, compiled_expression = _compile_expression(parameter)
+    values = [symbols_map.get(symbol) for symbol in symbols]
+    # Partial binding, binding symbols to other expressions, and values for which
+    # plain floats fail (e.g. division by zero or overflow) are left to sympy.
+    if all(isinstance(value, Number) for value in values):
+        try:
+            return compiled_expression(*values)
+        except (TypeError, ValueError, ArithmeticError):
+            pass
+    return parameter.subs(symbols_map)
+
+
+def _bind_operation(
+    operation: Operation, symbols_map: Dict[sympy.Symbol, Any]
+) -> Operation:
+    if not operation.free_symbols:
+        return operation
+
+    return operation.replace_params(
+        tuple(_bind_parameter(param, symbols_map) for param in operation.params)
+    )
+
+
+def _bind_circuit(circuit: Circuit, symbols_map: Dict[sympy.Symbol, Any]) -> Circuit:
+    return Circuit(
+        [_bind_operation(operation, symbols_map) for operation in circuit.operations],
+        n_qubits=circuit.n_qubits,
+    )
 
 
 def evaluate_estimation_circuits(
@@ -20,6 +90,10 @@ def evaluate_estimation_circuits(
     If one symbols map is given, it is used to evaluate all circuits. Otherwise, the
     symbols map at index i will be used for the estimation task at index i.
 
+    Parametrized expressions are compiled into plain Python callables once per
+    distinct expression, so that repeated evaluations (e.g. parameter sweeps) avoid
+    the overhead of sympy's substitution machinery.
+
     Args:
         estimation_tasks: the estimation tasks which contain the circuits to be
             evaluated
@@ -29,7 +103,7 @@ def evaluate_estimation_circuits(
     return [
         EstimationTask(
             operator=estimation_task.operator,
-            circuit=estimation_task.circuit.bind(symbols_map),
+            circuit=_bind_circuit(estimation_task.circuit, dict(symbols_map)),
             number_of_shots=estimation_task.number_of_shots,
         )
         for estimation_task, symbols_map in zip(estimation_tasks, symbols_maps)
@@ -101,7 +175,10 @@ def evaluate_non_measured_estimation_tasks(
     for task in estimation_tasks:
         coefficient: complex
         if task.operator.is_constant:
-            coefficient = task.operator.terms[0].coefficient
+            # Expectation value of identity terms is just the sum of their coefficients
+            coefficient = sum(
+                (term.coefficient for term in task.operator.terms), complex(0.0)
+            )
         else:
             if task.number_of_shots is not None and task.number_of_shots > 0:
                 raise RuntimeError(
@@ -112,16 +189,78 @@ def evaluate_non_measured_estimation_tasks(
                 coefficient = 0.0
 
         expectation_values.append(
-            ExpectationValues(
-                np.asarray([coefficient]),
-                correlations=[np.asarray([[0.0]])],
-                estimator_covariances=[np.asarray([[0.0]])],
+            expectation_values_to_real(
+                ExpectationValues(
+                    np.asarray([coefficient]),
+                    correlations=[np.asarray([[0.0]])],
+                    estimator_covariances=[np.asarray([[0.0]])],
+                )
             )
         )
 
     return expectation_values
 
 
+def _change_frame_to_z_basis(
+    circuit: Circuit, operator: PauliSum
+) -> Tuple[Circuit, PauliSum]:
+    """Append basis changes to the circuit so that the given qubit-wise commuting
+    operator can be measured in the Z basis.
+
+    Returns:
+        the circuit with basis changes appended and the operator with every Pauli
+            operator replaced by Z.
+    """
+    if operator.is_ising:
+        return circuit, operator
+
+    frame = dict(chain.from_iterable(term.operations for term in operator.terms))
+    for qubit_index, op in sorted(frame.items()):
+        if op == "X":
+            circuit += H(qubit_index)
+        elif op == "Y":
+            circuit += RX(np.pi / 2)(qubit_index)
+
+    z_operator = PauliSum(
+        [
+            PauliTerm(
+                {qubit_index: "Z" for qubit_index in term.qubits}, term.coefficient
+            )
+            for term in operator.terms
+        ]
+    )
+    return circuit, z_operator
+
+
+def split_estimation_tasks_into_qwc_frames(
+    estimation_tasks: List[EstimationTask],
+) -> List[EstimationTask]:
+    """Split estimation tasks into tasks measuring qubit-wise commuting frames.
+
+    Terms of each task's operator are grouped using group_qwc. Every group becomes
+    a separate task with the original number of shots, whose circuit has basis
+    changes appended, so that its operator is Ising and all its terms are estimated
+    from a single set of measurements. This function conforms to
+    EstimationPreprocessor protocol.
+
+    Args:
+        estimation_tasks: list of estimation tasks to be split
+
+    Returns:
+        list of estimation tasks, in which tasks for frames of every original task
+            are placed consecutively. Terms of each frame preserve their relative
+            order in the original operator.
+    """
+    return [
+        EstimationTask(frame_operator, frame_circuit, task.number_of_shots)
+        for task in estimation_tasks
+        for frame_circuit, frame_operator in (
+            _change_frame_to_z_basis(task.circuit, group)
+            for group in group_qwc(task.operator)
+        )
+    ]
+
+
 def estimate_expectation_values_by_averaging(
     backend: QuantumBackend,
     estimation_tasks: List[EstimationTask],
@@ -129,7 +268,8 @@ def estimate_expectation_values_by_averaging(
     """Basic method for estimating expectation values for list of estimation tasks.
 
     It executes specified circuit and calculates expectation values based on the
-    measurements.
+    measurements. Operators need to be Ising; tasks with other operators can be
+    converted to Ising ones with split_estimation_tasks_into_qwc_frames.
 
     Args:
         backend: backend used for executing circuits
@@ -186,20 +326,57 @@ def estimate_expectation_values_by_averaging(
     return cast(List[ExpectationValues], full_expectation_values)
 
 
+def _find_cached_expectation_values(
+    cache: Deque[Tuple[Circuit, PauliRepresentation, ExpectationValues]],
+    circuit: Circuit,
+    operator: PauliRepresentation,
+) -> Optional[ExpectationValues]:
+    # Identity rather than equality is checked: comparing circuits is expensive and
+    # tolerance-based, which would make the lookup slower than simulation itself.
+    for cached_circuit, cached_operator, expectation_values in cache:
+        if cached_circuit is circuit and cached_operator is operator:
+            return expectation_values
+    return None
+
+
 def calculate_exact_expectation_values(
     backend: QuantumSimulator,
     estimation_tasks: List[EstimationTask],
+    symbols_map: Optional[Dict[sympy.Symbol, float]] = None,
 ) -> List[ExpectationValues]:
     """Calculates exact expectation values using built-in method of a provided backend.
 
+    If symbols_map is provided, parametrized circuits are bound to it before being
+    simulated, so that the wavefunction is computed numerically instead of
+    symbolically. Since exact expectation values are deterministic, repeated
+    tasks sharing the same circuit and operator objects are simulated only once.
+
     Args:
         backend: backend used for executing circuits
         estimation_tasks: list of estimation tasks
+        symbols_map: optional map of the symbols used in the circuits to their
+            values.
     """
-    expectation_values_list = [
-        backend.get_exact_expectation_values(
-            estimation_task.circuit, estimation_task.operator
+    cache: Deque[Tuple[Circuit, PauliRepresentation, ExpectationValues]] = deque(
+        maxlen=EXACT_EXPECTATION_VALUES_CACHE_SIZE
+    )
+    expectation_values_list = []
+    for estimation_task in estimation_tasks:
+        circuit = (
+            _bind_circuit(estimation_task.circuit, symbols_map)
+            if symbols_map is not None and estimation_task.circuit.free_symbols
+            else estimation_task.circuit
         )
-        for estimation_task in estimation_tasks
-    ]
+        cached_expectation_values = _find_cached_expectation_values(
+            cache, circuit, estimation_task.operator
+        )
+        if cached_expectation_values is not None:
+            expectation_values_list.append(copy.deepcopy(cached_expectation_values))
+        else:
+            expectation_values = backend.get_exact_expectation_values(
+                circuit, estimation_task.operator
+            )
+            cache.append((circuit, estimation_task.operator, expectation_values))
+            expectation_values_list.append(expectation_values)
+
     return expectation_values_list
@@ -11,7 +11,7 @@ from typing import Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
 import numpy as np
 
 from ..distributions import MeasurementOutcomeDistribution
-from ..operators import PauliRepresentation
+from ..operators import PauliRepresentation, PauliTerm
 from ..typing import AnyPath
 from ..utils import convert_tuples_to_bitstrings, sample_from_probability_distribution
 from .expectation_values import ExpectationValues
@@ -71,6 +71,60 @@ def get_expectation_value_from_frequencies(
     return expectation_values.sum().item()
 
 
+# Number of distinct bitstrings for which term eigenvalues are computed at once,
+# bounding memory used by intermediate arrays.
+_EIGENVALUES_CHUNK_SIZE = 4096
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Pack each row of a 2d array of bits into 64-bit words."""
+    packed_bytes = np.packbits(bits, axis=1, bitorder="little")
+    n_padding_bytes = -packed_bytes.shape[1] % 8
+    return np.pad(packed_bytes, ((0, 0), (0, n_padding_bytes))).view(np.uint64)
+
+
+def _parity(words: np.ndarray) -> np.ndarray:
+    """Compute parity of the number of set bits in each of 64-bit words.
+
+    The computation is done in place, i.e. content of words is overwritten.
+    """
+    for shift in (32, 16, 8, 4, 2, 1):
+        words ^= words >> np.uint64(shift)
+    words &= np.uint64(1)
+    return words
+
+
+def _get_z_terms_eigenvalues(
+    bitstrings: np.ndarray, terms: Sequence[PauliTerm]
+) -> np.ndarray:
+    """Compute eigenvalues of Z terms for each of the measured bitstrings.
+
+    Bitstrings and terms' supports are packed into 64-bit words, so that eigenvalue
+    of a term, (-1) ** popcount(bitstring & mask), requires only a handful of
+    bitwise operations per bitstring regardless of the number of qubits.
+
+    Args:
+        bitstrings: 2d array of bits, of shape number of bitstrings * number of qubits
+        terms: Ising terms (i.e. comprising only Z operators) to evaluate.
+
+    Returns:
+        Array of shape number of bitstrings * number of terms, in which each entry
+        is the eigenvalue (+1 or -1) of the corresponding term.
+    """
+    masks = np.zeros((len(terms), bitstrings.shape[1]), dtype=np.uint8)
+    for i, term in enumerate(terms):
+        masks[i, list(term.qubits)] = 1
+
+    packed_bitstrings = _pack_bits(bitstrings)
+    packed_masks = _pack_bits(masks)
+
+    # Words are combined with xor first, since parity of xor is xor of parities.
+    marked_bits = np.bitwise_xor.reduce(
+        packed_bitstrings[:, np.newaxis, :] & packed_masks[np.newaxis, :, :], axis=-1
+    )
+    return 1 - 2 * _parity(marked_bits).astype(np.int8)
+
+
 def _check_sample_elimination(
     samples: Counter,
     bitstring_samples: List[Tuple[int, ...]],
@@ -144,6 +198,22 @@ class Measurements:
         measurements.add_counts(counts)
         return measurements
 
+    @classmethod
+    def from_array(cls, bitstrings: np.ndarray):
+        """Create an instance of the Measurements class from an array of bits
+
+        Args:
+            bitstrings: 2d array of shape number of measurements * number of qubits,
+                in which each row is a single measured bitstring
+        """
+        bitstrings = np.asarray(bitstrings)
+        if bitstrings.ndim != 2:
+            raise ValueError(
+                f"Bitstrings have to be given as a 2d array, got {bitstrings.ndim}d."
+            )
+        # tolist converts the whole array to native Python ints at once.
+        return cls([tuple(bitstring) for bitstring in bitstrings.tolist()])
+
     @classmethod
     def get_measurements_representing_distribution(
         cls,
@@ -304,34 +374,30 @@ class Measurements:
         if not ising_operator.is_ising:
             raise TypeError("Input operator is not ising.")
 
-        # Count number of occurrences of bitstrings
-        bitstring_frequencies = self.get_counts()
         num_measurements = len(self.bitstrings)
+        terms = ising_operator.terms
 
-        # Perform weighted average
-        expectation_values_list = [
-            term.coefficient
-            * get_expectation_value_from_frequencies(term.qubits, bitstring_frequencies)
-            for term in ising_operator.terms
-        ]
-        expectation_values = np.array(expectation_values_list)
-
-        correlations = np.zeros((len(ising_operator.terms),) * 2, dtype=complex)
-        for i, first_term in enumerate(ising_operator.terms):
-            correlations[i, i] = first_term.coefficient**2
-            for j in range(i):
-                second_term = ising_operator.terms[j]
-                marked_qubits = first_term.qubits.symmetric_difference(
-                    second_term.qubits
-                )
-                correlations[i, j] = (
-                    first_term.coefficient
-                    * second_term.coefficient
-                    * get_expectation_value_from_frequencies(
-                        marked_qubits, bitstring_frequencies
-                    )
-                )
-                correlations[j, i] = correlations[i, j]
+        unique_bitstrings, counts = np.unique(
+            np.asarray(self.bitstrings, dtype=np.int8), axis=0, return_counts=True
+        )
+        frequencies = counts / num_measurements
+
+        # Average eigenvalues (+1 or -1) of terms and their pairwise products over
+        # distinct bitstrings, weighted by frequencies of those bitstrings.
+        mean_eigenvalues = np.zeros(len(terms))
+        mean_eigenvalue_products = np.zeros((len(terms), len(terms)))
+        for start in range(0, len(unique_bitstrings), _EIGENVALUES_CHUNK_SIZE):
+            chunk = slice(start, start + _EIGENVALUES_CHUNK_SIZE)
+            eigenvalues = _get_z_terms_eigenvalues(
+                unique_bitstrings[chunk], terms
+            ).astype(float)
+            weighted_eigenvalues = frequencies[chunk, np.newaxis] * eigenvalues
+            mean_eigenvalues += weighted_eigenvalues.sum(axis=0)
+            mean_eigenvalue_products += eigenvalues.T @ weighted_eigenvalues
+
+        coefficients = np.array([term.coefficient for term in terms])
+        expectation_values = coefficients * mean_eigenvalues
+        correlations = np.outer(coefficients, coefficients) * mean_eigenvalue_products
 
         denominator = (
             num_measurements - 1 if use_bessel_correction else num_measurements
@@ -19,4 +19,4 @@ from ._openfermion_utils import (
     is_hermitian,
 )
 from ._pauli_operators import PauliRepresentation, PauliSum, PauliTerm
-from ._utils import get_expectation_value, reverse_qubit_order
+from ._utils import get_expectation_value, group_qwc, reverse_qubit_order
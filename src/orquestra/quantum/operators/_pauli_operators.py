@@ -16,6 +16,7 @@
 import re
 import warnings
 from collections import OrderedDict
+from functools import lru_cache
 from itertools import chain, product
 from typing import (
     Any,
@@ -108,9 +109,12 @@ def _parse_operator(op_str: str) -> Tuple[int, str]:
     return int(match.group(2)), match.group(1).upper()
 
 
+@lru_cache(maxsize=256)
 def _parse_operators_and_coefficient(
     term_str: str,
-) -> Tuple[Optional[complex], Dict[int, str]]:
+) -> Tuple[Optional[complex], Tuple[Tuple[int, str], ...]]:
+    # Results are cached, hence operators are returned as an immutable sequence of
+    # (qubit index, operator) pairs rather than a dict.
     parts = re.split(r"\ *\*\ *", term_str.strip(" "))
     try:
         coef = _parse_complex(parts[0])
@@ -124,7 +128,7 @@ def _parse_operators_and_coefficient(
     if len(operators_dict) != len(operators_strs):
         raise ValueError("Duplicate qubit index in a term detected.")
 
-    return coef, dict([_parse_operator(op_str) for op_str in operators_strs])
+    return coef, tuple(operators_dict.items())
 
 
 class PauliTerm:
@@ -140,7 +144,10 @@ class PauliTerm:
         coefficient: Optional[complex] = None,
     ):
         if isinstance(operator, str):
-            _parsed_coefficient, operator = _parse_operators_and_coefficient(operator)
+            _parsed_coefficient, parsed_operators = _parse_operators_and_coefficient(
+                operator
+            )
+            operator = dict(parsed_operators)
             if _parsed_coefficient is not None and coefficient is not None:
                 raise ValueError(
                     "Coefficient can be provided either in an argument or string "
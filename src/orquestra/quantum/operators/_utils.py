@@ -276,6 +276,45 @@ def reverse_qubit_order(
     return reversed_op
 
 
+def _qubitwise_commute(first_term: PauliTerm, second_term: PauliTerm) -> bool:
+    first_term_ops = dict(first_term.operations)
+    return all(
+        first_term_ops.get(qubit_index, op) == op
+        for qubit_index, op in second_term.operations
+    )
+
+
+def group_qwc(operator: PauliRepresentation) -> List[PauliSum]:
+    """Group terms of an operator into sets of qubit-wise commuting terms.
+
+    Two terms commute qubit-wise if, on every qubit they both act on, they act with
+    the same Pauli operator. All terms in a group can therefore be estimated from a
+    single set of measurements. Groups are built greedily: each term is put into
+    the first group it commutes qubit-wise with, or into a new group otherwise.
+    Ising operators always form a single group and are returned without grouping.
+
+    Args:
+        operator: the operator to be grouped
+
+    Returns:
+        list of groups, each of them preserving the relative order of terms in
+            the operator
+    """
+    if operator.is_ising:
+        return [PauliSum(list(operator.terms))]
+
+    groups: List[List[PauliTerm]] = []
+    for term in operator.terms:
+        for group in groups:
+            if all(_qubitwise_commute(term, other_term) for other_term in group):
+                group.append(term)
+                break
+        else:
+            groups.append([term])
+
+    return [PauliSum(group) for group in groups]
+
+
 def get_expectation_value(
     qubit_op: PauliRepresentation,
     wavefunction: Wavefunction,
@@ -1,6 +1,8 @@
 ################################################################################
 # © Copyright 2020-2022 Zapata Computing Inc.
 ################################################################################
+from typing import Optional
+
 from ..api.backend import QuantumBackend
 from ..backends import SymbolicSimulator
 from ..circuits import Circuit
@@ -11,13 +13,19 @@ class MockQuantumBackend(QuantumBackend):
 
     supports_batching = False
 
-    def __init__(self):
-        super().__init__()
-        self._simulator = SymbolicSimulator()
+    # The wrapped simulator is only used for sampling (its counters are never read),
+    # hence it is shared between all instances and created when first needed.
+    _simulator: Optional[SymbolicSimulator] = None
+
+    @classmethod
+    def _get_simulator(cls) -> SymbolicSimulator:
+        if cls._simulator is None:
+            cls._simulator = SymbolicSimulator()
+        return cls._simulator
 
     def run_circuit_and_measure(
         self, circuit: Circuit, n_samples: int, **kwargs
     ) -> Measurements:
         super(MockQuantumBackend, self).run_circuit_and_measure(circuit, n_samples)
 
-        return self._simulator.run_circuit_and_measure(circuit, n_samples)
+        return self._get_simulator().run_circuit_and_measure(circuit, n_samples)
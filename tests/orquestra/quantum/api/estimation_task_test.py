@@ -0,0 +1,58 @@
+################################################################################
+# © Copyright 2022 Zapata Computing Inc.
+################################################################################
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from orquestra.quantum.api.estimation import EstimationTask
+from orquestra.quantum.circuits import Circuit, H, X
+from orquestra.quantum.operators import PauliSum, PauliTerm
+
+
+@pytest.fixture
+def estimation_task():
+    return EstimationTask(PauliSum("Z0 + 2*Z0*Z1"), Circuit([H(0), X(1)]), 100)
+
+
+class TestEstimationTask:
+    def test_has_no_instance_dict(self, estimation_task):
+        assert not hasattr(estimation_task, "__dict__")
+
+    def test_is_immutable(self, estimation_task):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            estimation_task.number_of_shots = 10
+
+    def test_is_equal_to_task_with_same_fields(self, estimation_task):
+        assert estimation_task == EstimationTask(
+            PauliSum("Z0 + 2*Z0*Z1"), Circuit([H(0), X(1)]), 100
+        )
+        assert estimation_task != EstimationTask(
+            PauliTerm("Z0"), Circuit([H(0), X(1)]), 100
+        )
+
+    @pytest.mark.parametrize(
+        "copy_function",
+        [copy.copy, copy.deepcopy, lambda task: pickle.loads(pickle.dumps(task))],
+    )
+    def test_can_be_copied(self, estimation_task, copy_function):
+        assert copy_function(estimation_task) == estimation_task
+
+    def test_can_be_unpickled_from_dict_state(self, estimation_task):
+        # Mimics pickles of EstimationTask created before it declared __slots__,
+        # in which state of the task is its __dict__.
+        class _TaskWithDictState:
+            def __reduce__(self):
+                return (
+                    object.__new__,
+                    (EstimationTask,),
+                    {
+                        "operator": estimation_task.operator,
+                        "circuit": estimation_task.circuit,
+                        "number_of_shots": estimation_task.number_of_shots,
+                    },
+                )
+
+        assert pickle.loads(pickle.dumps(_TaskWithDictState())) == estimation_task
@@ -9,18 +9,26 @@ import sympy
 
 from orquestra.quantum.api.estimation import EstimationTask
 from orquestra.quantum.backends import SymbolicSimulator
-from orquestra.quantum.circuits import RX, RY, RZ, Circuit, H, X
+from orquestra.quantum.circuits import CNOT, RX, RY, RZ, Circuit, H, X
 from orquestra.quantum.estimation import (
     calculate_exact_expectation_values,
     estimate_expectation_values_by_averaging,
     evaluate_estimation_circuits,
     evaluate_non_measured_estimation_tasks,
+    split_estimation_tasks_into_qwc_frames,
     split_estimation_tasks_to_measure,
 )
 from orquestra.quantum.measurements import ExpectationValues, Measurements
 from orquestra.quantum.operators import PauliSum, PauliTerm
 from orquestra.quantum.testing import MockQuantumBackend
 
+# Building blocks shared by test cases below. Circuits and operators are never
+# modified in place, so the same instances can be safely reused.
+_CIRC_X0 = Circuit([X(0)])
+_CIRC_RZ0 = Circuit([RZ(np.pi / 2)(0)])
+_CIRC_RY0 = Circuit([RY(np.pi / 2)(0)])
+_OP_Z0_Z1Z2 = PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2")
+
 
 class TestEstimatorUtils:
     @pytest.fixture()
@@ -42,11 +50,11 @@ class TestEstimatorUtils:
         circuits[1] += RX(-0.0002)(0)
         circuits[1] += RY(0)(1)
 
-        for circuit in circuits[2:]:
-            circuit += RX(sympy.Symbol("theta_0"))(0)
-            circuit += RY(sympy.Symbol("theta_1"))(1)
-            circuit += RX(sympy.Symbol("theta_2"))(0)
-            circuit += RY(sympy.Symbol("theta_3"))(1)
+        for i in range(2, len(circuits)):
+            circuits[i] += RX(sympy.Symbol("theta_0"))(0)
+            circuits[i] += RY(sympy.Symbol("theta_1"))(1)
+            circuits[i] += RX(sympy.Symbol("theta_2"))(0)
+            circuits[i] += RY(sympy.Symbol("theta_3"))(1)
 
         return circuits
 
@@ -77,6 +85,87 @@ class TestEstimatorUtils:
         for new_task in new_estimation_tasks:
             assert len(new_task.circuit.free_symbols) == 0
 
+    def test_evaluate_estimation_circuits_binds_symbolic_expressions(self):
+        theta, phi = sympy.symbols("theta, phi")
+        circuit = Circuit([RX(2 * theta + phi)(0), RY(theta)(1), RZ(0.5)(0)])
+        estimation_tasks = [
+            EstimationTask(PauliSum(), circuit, 1),
+            EstimationTask(PauliSum(), circuit, 1),
+        ]
+        symbols_maps = [{theta: 0.1, phi: 0.2}, {theta: -0.5, phi: 1.0}]
+
+        new_estimation_tasks = evaluate_estimation_circuits(
+            estimation_tasks, symbols_maps
+        )
+
+        for new_task, symbols_map in zip(new_estimation_tasks, symbols_maps):
+            assert new_task.circuit == circuit.bind(symbols_map)
+            assert len(new_task.circuit.free_symbols) == 0
+
+    @pytest.mark.parametrize(
+        "expression_factory",
+        [sympy.Max, lambda t, p: sympy.re(t) + p, lambda t, p: sympy.Heaviside(t)],
+    )
+    def test_evaluate_estimation_circuits_binds_functions_missing_in_math_module(
+        self, expression_factory
+    ):
+        t, p = sympy.symbols("t, p")
+        circuit = Circuit([RX(expression_factory(t, p))(0)])
+        symbols_map = {t: 0.3, p: -0.2}
+
+        new_estimation_tasks = evaluate_estimation_circuits(
+            [EstimationTask(PauliSum(), circuit, 1)], [symbols_map]
+        )
+
+        assert new_estimation_tasks[0].circuit == circuit.bind(symbols_map)
+        assert len(new_estimation_tasks[0].circuit.free_symbols) == 0
+
+    @pytest.mark.parametrize(
+        "parameter, symbols_map",
+        [
+            (1 / sympy.Symbol("t"), {sympy.Symbol("t"): 0}),
+            (
+                sympy.exp(sympy.Symbol("t")) + sympy.Symbol("p"),
+                {sympy.Symbol("t"): 1000, sympy.Symbol("p"): 0},
+            ),
+            (
+                sympy.Symbol("x") + sympy.Symbol("x", real=True),
+                {sympy.Symbol("x"): 1, sympy.Symbol("x", real=True): 2},
+            ),
+            (
+                sympy.Symbol("pi") * sympy.Symbol("e"),
+                {sympy.Symbol("pi"): 2, sympy.Symbol("e"): 3},
+            ),
+        ],
+    )
+    def test_evaluate_estimation_circuits_binds_parameters_same_as_circuit_bind(
+        self, parameter, symbols_map
+    ):
+        circuit = Circuit([RX(parameter)(0)])
+
+        new_estimation_tasks = evaluate_estimation_circuits(
+            [EstimationTask(PauliSum(), circuit, 1)], [symbols_map]
+        )
+
+        # Parameters are compared directly, as circuits compare them numerically,
+        # which fails for complex infinity.
+        assert (
+            new_estimation_tasks[0].circuit.operations[0].params
+            == circuit.bind(symbols_map).operations[0].params
+        )
+
+    def test_evaluate_estimation_circuits_with_partial_symbols_map(self):
+        theta, phi = sympy.symbols("theta, phi")
+        circuit = Circuit([RX(2 * theta + phi)(0), RY(theta)(1)])
+        estimation_tasks = [EstimationTask(PauliSum(), circuit, 1)]
+
+        new_estimation_tasks = evaluate_estimation_circuits(
+            estimation_tasks, [{theta: 0.1}]
+        )
+
+        assert new_estimation_tasks[0].circuit == circuit.bind({theta: 0.1})
+        assert new_estimation_tasks[0].circuit.free_symbols == [phi]
+
     @pytest.mark.parametrize(
         ",".join(
             [
@@ -92,7 +181,7 @@ class TestEstimatorUtils:
                 [
                     EstimationTask(
                         PauliSum([PauliTerm("Z0", 2), PauliTerm("3*Z1*Z2")]),
-                        Circuit([X(0)]),
+                        _CIRC_X0,
                         10,
                     ),
                     EstimationTask(
@@ -103,29 +192,29 @@ class TestEstimatorUtils:
                                 PauliTerm("I0", 4),
                             ]
                         ),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        _CIRC_RZ0,
                         1000,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         17,
                     ),
                 ],
                 [
                     EstimationTask(
-                        PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([X(0)]),
+                        _OP_Z0_Z1Z2,
+                        _CIRC_X0,
                         10,
                     ),
                     EstimationTask(
-                        PauliTerm("I0", 4) + PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        PauliTerm("I0", 4) + _OP_Z0_Z1Z2,
+                        _CIRC_RZ0,
                         1000,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         17,
                     ),
                 ],
@@ -136,95 +225,95 @@ class TestEstimatorUtils:
             (
                 [
                     EstimationTask(
-                        PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([X(0)]),
+                        _OP_Z0_Z1Z2,
+                        _CIRC_X0,
                         10,
                     ),
                     EstimationTask(
                         PauliTerm("I0", 4),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        _CIRC_RZ0,
                         1000,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         17,
                     ),
                 ],
                 [
                     EstimationTask(
-                        PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([X(0)]),
+                        _OP_Z0_Z1Z2,
+                        _CIRC_X0,
                         10,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         17,
                     ),
                 ],
-                [EstimationTask(PauliTerm("I0", 4), Circuit([RZ(np.pi / 2)(0)]), 1000)],
+                [EstimationTask(PauliTerm("I0", 4), _CIRC_RZ0, 1000)],
                 [0, 2],
                 [1],
             ),
             (
                 [
-                    EstimationTask(PauliTerm("I0", -3), Circuit([X(0)]), 0),
+                    EstimationTask(PauliTerm("I0", -3), _CIRC_X0, 0),
                     EstimationTask(
-                        PauliTerm("I0", 4) + PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        PauliTerm("I0", 4) + _OP_Z0_Z1Z2,
+                        _CIRC_RZ0,
                         1000,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         17,
                     ),
                 ],
                 [
                     EstimationTask(
-                        PauliTerm("I0", 4) + PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        PauliTerm("I0", 4) + _OP_Z0_Z1Z2,
+                        _CIRC_RZ0,
                         1000,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         17,
                     ),
                 ],
                 [
-                    EstimationTask(PauliTerm("I0", -3), Circuit([X(0)]), 0),
+                    EstimationTask(PauliTerm("I0", -3), _CIRC_X0, 0),
                 ],
                 [1, 2],
                 [0],
             ),
             (
                 [
-                    EstimationTask(PauliTerm("I0", -3), Circuit([X(0)]), 0),
+                    EstimationTask(PauliTerm("I0", -3), _CIRC_X0, 0),
                     EstimationTask(
-                        PauliTerm("I0", 4) + PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        PauliTerm("I0", 4) + _OP_Z0_Z1Z2,
+                        _CIRC_RZ0,
                         1000,
                     ),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         0,
                     ),
                 ],
                 [
                     EstimationTask(
-                        PauliTerm("I0", 4) + PauliTerm("Z0", 2) + PauliTerm("3*Z1*Z2"),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        PauliTerm("I0", 4) + _OP_Z0_Z1Z2,
+                        _CIRC_RZ0,
                         1000,
                     ),
                 ],
                 [
-                    EstimationTask(PauliTerm("I0", -3), Circuit([X(0)]), 0),
+                    EstimationTask(PauliTerm("I0", -3), _CIRC_X0, 0),
                     EstimationTask(
                         PauliTerm("Z3", 4),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         0,
                     ),
                 ],
@@ -254,6 +343,37 @@ class TestEstimatorUtils:
         assert indices_to_measure == ref_indices_to_measure
         assert ref_non_measured_indices == indices_for_non_measureds
 
+    def test_split_estimation_tasks_into_qwc_frames(self):
+        ising_task = EstimationTask(_OP_Z0_Z1Z2, _CIRC_X0, 10)
+        estimation_tasks = [
+            EstimationTask(PauliSum("X0 + 2*Z0 + 3*X1 + 4*I0 + 5*Y1"), _CIRC_X0, 20),
+            ising_task,
+        ]
+
+        assert split_estimation_tasks_into_qwc_frames(estimation_tasks) == [
+            EstimationTask(
+                PauliSum("Z0 + 3*Z1 + 4*I0"), Circuit([X(0), H(0), H(1)]), 20
+            ),
+            EstimationTask(
+                PauliSum("2*Z0 + 5*Z1"), Circuit([X(0), RX(np.pi / 2)(1)]), 20
+            ),
+            ising_task,
+        ]
+
+    def test_split_estimation_tasks_to_measure_with_unspecified_shots(self):
+        estimation_tasks = [
+            EstimationTask(PauliTerm("Z0"), _CIRC_X0, None),
+            EstimationTask(PauliTerm("I0", 2.0), _CIRC_X0, None),
+        ]
+
+        assert split_estimation_tasks_to_measure(estimation_tasks) == (
+            estimation_tasks[:1],
+            estimation_tasks[1:],
+            [0],
+            [1],
+        )
+        assert split_estimation_tasks_to_measure([]) == ([], [], [], [])
+
     @pytest.mark.parametrize(
         "estimation_tasks,ref_expectation_values",
         [
@@ -261,7 +381,7 @@ class TestEstimatorUtils:
                 [
                     EstimationTask(
                         PauliTerm("I0", 4),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        _CIRC_RZ0,
                         1000,
                     ),
                 ],
@@ -277,15 +397,13 @@ class TestEstimatorUtils:
                 [
                     EstimationTask(
                         PauliTerm("I0", -0.5) + PauliTerm("I0", -2.5),
-                        Circuit([X(0)]),
+                        _CIRC_X0,
                         0,
                     ),
-                    EstimationTask(
-                        PauliTerm("I0", 0.001), Circuit([RZ(np.pi / 2)(0)]), 2
-                    ),
+                    EstimationTask(PauliTerm("I0", 0.001), _CIRC_RZ0, 2),
                     EstimationTask(
                         PauliTerm("Z1", 2.5) + PauliTerm("1*Z2*Z3"),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         0,
                     ),
                 ],
@@ -322,6 +440,23 @@ class TestEstimatorUtils:
                 ex_val.estimator_covariances, ref_ex_val.estimator_covariances
             )
 
+    @pytest.mark.parametrize(
+        "operator,target_value",
+        [
+            (PauliSum([PauliTerm("I0", -0.5), PauliTerm("I0", -2.5)]), -3.0),
+            (PauliSum(), 0.0),
+        ],
+    )
+    def test_evaluate_non_measured_estimation_tasks_sums_all_constant_terms(
+        self, operator, target_value
+    ):
+        expectation_values = evaluate_non_measured_estimation_tasks(
+            [EstimationTask(operator, _CIRC_X0, 10)]
+        )
+
+        np.testing.assert_array_equal(expectation_values[0].values, [target_value])
+        assert not np.iscomplexobj(expectation_values[0].values)
+
     @pytest.mark.parametrize(
         "estimation_tasks",
         [
@@ -329,7 +464,7 @@ class TestEstimatorUtils:
                 [
                     EstimationTask(
                         PauliSum([PauliTerm("I0", -2.5), PauliTerm("Z1", -0.5)]),
-                        Circuit([X(0)]),
+                        _CIRC_X0,
                         1,
                     ),
                 ]
@@ -338,15 +473,13 @@ class TestEstimatorUtils:
                 [
                     EstimationTask(
                         PauliTerm("Z0", 0.001),
-                        Circuit([RZ(np.pi / 2)(0)]),
+                        _CIRC_RZ0,
                         0,
                     ),
-                    EstimationTask(
-                        PauliTerm("I0", 2.0), Circuit([RZ(np.pi / 2)(0)]), 2
-                    ),
+                    EstimationTask(PauliTerm("I0", 2.0), _CIRC_RZ0, 2),
                     EstimationTask(
                         PauliTerm("1.5*Z0*Z1"),
-                        Circuit([RY(np.pi / 2)(0)]),
+                        _CIRC_RY0,
                         10,
                     ),
                 ]
@@ -363,9 +496,7 @@ class TestEstimatorUtils:
 TEST_CASES_EIGENSTATES = [
     (
         [
-            EstimationTask(
-                PauliTerm("Z0"), circuit=Circuit([X(0)]), number_of_shots=10
-            ),
+            EstimationTask(PauliTerm("Z0"), circuit=_CIRC_X0, number_of_shots=10),
             EstimationTask(
                 PauliTerm("I0", coefficient=2.0),
                 circuit=Circuit([RY(np.pi / 4)(0)]),
@@ -470,26 +601,26 @@ TEST_CASES_NONEIGENSTATES_WITH_LOW_NUMBER_OF_SHOTS = [
 class MockBackendForTestingCovariancewhenNumberOfShotsIsLow:
     def run_circuitset_and_measure(self, circuit, shots_per_circuit):
         return [
-            Measurements([(0, 1), (0, 0)]),
-            Measurements([(1, 0), (0, 0)]),
-            Measurements([(1, 0), (0, 1)]),
-            Measurements([(1, 1), (0, 0)] * 10),
+            Measurements.from_array(np.array([[0, 1], [0, 0]], dtype=np.int8)),
+            Measurements.from_array(np.array([[1, 0], [0, 0]], dtype=np.int8)),
+            Measurements.from_array(np.array([[1, 0], [0, 1]], dtype=np.int8)),
+            Measurements.from_array(
+                np.tile(np.array([[1, 1], [0, 0]], dtype=np.int8), (10, 1))
+            ),
         ]
 
 
 class TestBasicEstimationMethods:
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def simulator(self):
         return SymbolicSimulator()
 
     @pytest.fixture()
     def estimation_tasks(self):
-        task_1 = EstimationTask(
-            PauliTerm("Z0"), circuit=Circuit([X(0)]), number_of_shots=10
-        )
+        task_1 = EstimationTask(PauliTerm("Z0"), circuit=_CIRC_X0, number_of_shots=10)
         task_2 = EstimationTask(
             PauliTerm("Z0"),
-            circuit=Circuit([RY(np.pi / 2)(0)]),
+            circuit=_CIRC_RY0,
             number_of_shots=20,
         )
         task_3 = EstimationTask(
@@ -566,17 +697,17 @@ class TestBasicEstimationMethods:
         for expectation_values, target, task in zip(
             expectation_values_list, target_expectations, estimation_tasks
         ):
-            for cov, corr, target_corr, target_cov in zip(
-                expectation_values.estimator_covariances,
-                expectation_values.correlations,
-                target.correlations,
-                target.estimator_covariances,
-            ):
-                assert len(corr) == len(task.operator.terms)
-                assert len(cov) == len(task.operator.terms)
+            correlations = np.stack(expectation_values.correlations)
+            covariances = np.stack(expectation_values.estimator_covariances)
+            assert correlations.shape[-1] == len(task.operator.terms)
+            assert covariances.shape[-1] == len(task.operator.terms)
 
-                np.testing.assert_array_almost_equal(corr, target_corr, decimal=2)
-                np.testing.assert_array_almost_equal(cov, target_cov, decimal=2)
+            np.testing.assert_allclose(
+                correlations, np.stack(target.correlations), atol=1.5e-2
+            )
+            np.testing.assert_allclose(
+                covariances, np.stack(target.estimator_covariances), atol=1.5e-2
+            )
 
     @pytest.mark.parametrize(
         "estimation_tasks,target_expectations",
@@ -592,18 +723,18 @@ class TestBasicEstimationMethods:
         for expectation_values, target, task in zip(
             expectation_values_list, target_expectations, estimation_tasks
         ):
-            for cov, corr, target_corr, target_cov in zip(
-                expectation_values.estimator_covariances,
-                expectation_values.correlations,
-                target.correlations,
-                target.estimator_covariances,
-            ):
-                assert len(corr) == len(task.operator.terms)
-                assert len(cov) == len(task.operator.terms)
+            correlations = np.stack(expectation_values.correlations)
+            covariances = np.stack(expectation_values.estimator_covariances)
+            assert correlations.shape[-1] == len(task.operator.terms)
+            assert covariances.shape[-1] == len(task.operator.terms)
 
-                np.testing.assert_array_almost_equal(corr, target_corr, decimal=1)
-                # All covariances should be close to 0 when number_of_shots is high.
-                np.testing.assert_array_almost_equal(target_cov, cov, decimal=2)
+            np.testing.assert_allclose(
+                correlations, np.stack(target.correlations), atol=1.5e-1
+            )
+            # All covariances should be close to 0 when number_of_shots is high.
+            np.testing.assert_allclose(
+                covariances, np.stack(target.estimator_covariances), atol=1.5e-2
+            )
 
     @pytest.mark.parametrize(
         "mock_estimation_tasks, target_expectations",
@@ -631,6 +762,121 @@ class TestBasicEstimationMethods:
                 decimal=2,
             )
 
+    def test_estimate_expectation_values_by_averaging_preserves_order_of_terms(
+        self, simulator
+    ):
+        estimation_tasks = [
+            EstimationTask(
+                PauliSum("2*Z1 + Z0*Z1 + 3*I0 + 0.5*Z0"),
+                circuit=Circuit([X(0)], n_qubits=2),
+                number_of_shots=10,
+            ),
+        ]
+
+        expectation_values_list = estimate_expectation_values_by_averaging(
+            simulator, estimation_tasks
+        )
+
+        np.testing.assert_array_almost_equal(
+            expectation_values_list[0].values, [2, -1, 3, -0.5]
+        )
+        np.testing.assert_array_almost_equal(
+            expectation_values_list[0].values,
+            calculate_exact_expectation_values(simulator, estimation_tasks)[0].values,
+        )
+
+    def test_estimate_expectation_values_by_averaging_measures_each_qwc_frame_once(
+        self,
+    ):
+        simulator = SymbolicSimulator()
+        bell_state_circuit = Circuit([H(0), CNOT(0, 1), RX(-np.pi / 2)(2)])
+        estimation_tasks = split_estimation_tasks_into_qwc_frames(
+            [
+                EstimationTask(
+                    PauliSum("Z0*Z1 + 2*X0*X1 + 3*Y2 + 0.5*Z0*Z1*Y2"),
+                    circuit=bell_state_circuit,
+                    number_of_shots=10,
+                ),
+            ]
+        )
+
+        expectation_values_list = estimate_expectation_values_by_averaging(
+            simulator, estimation_tasks
+        )
+
+        assert simulator.number_of_circuits_run == 2
+        np.testing.assert_array_almost_equal(
+            expectation_values_list[0].values, [1, 3, 0.5]
+        )
+        np.testing.assert_array_almost_equal(expectation_values_list[1].values, [2])
+
+    def test_calculate_exact_expectation_values_binds_symbols_before_simulating(
+        self, simulator
+    ):
+        theta = sympy.Symbol("theta")
+        operator = PauliSum([PauliTerm("Z0"), PauliTerm("Z1", 2.0)])
+        estimation_tasks = [
+            EstimationTask(operator, Circuit([RY(theta)(0), RX(2 * theta)(1)]), 10),
+            EstimationTask(operator, Circuit([X(1)]), 10),
+        ]
+        symbols_map = {theta: np.pi / 4}
+
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks, symbols_map
+        )
+        target_expectation_values_list = calculate_exact_expectation_values(
+            simulator,
+            [
+                EstimationTask(
+                    task.operator, task.circuit.bind(symbols_map), task.number_of_shots
+                )
+                for task in estimation_tasks
+            ],
+        )
+
+        for expectation_values, target in zip(
+            expectation_values_list, target_expectation_values_list
+        ):
+            assert expectation_values.values.dtype != object
+            np.testing.assert_array_almost_equal(
+                expectation_values.values, target.values
+            )
+
+    def test_calculate_exact_expectation_values_simulates_repeated_tasks_once(self):
+        simulator = SymbolicSimulator()
+        estimation_tasks = 4 * [
+            EstimationTask(
+                PauliSum([PauliTerm("Z0"), PauliTerm("Z1")]),
+                circuit=Circuit([H(0), X(1)]),
+                number_of_shots=10,
+            ),
+        ] + [EstimationTask(PauliTerm("Z0"), _CIRC_X0, 10)]
+
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks
+        )
+
+        assert simulator.number_of_circuits_run == 2
+        for expectation_values in expectation_values_list[:4]:
+            np.testing.assert_array_almost_equal(expectation_values.values, [0, -1])
+        np.testing.assert_array_almost_equal(expectation_values_list[4].values, [-1])
+
+    def test_calculate_exact_expectation_values_does_not_reuse_values_for_equal_copies(
+        self,
+    ):
+        simulator = SymbolicSimulator()
+        estimation_tasks = [
+            EstimationTask(PauliTerm("Z0", 1.0), Circuit([X(0)]), 10),
+            EstimationTask(PauliTerm("Z0", 1.0 + 1e-7), Circuit([X(0)]), 10),
+        ]
+
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks
+        )
+
+        assert simulator.number_of_circuits_run == 2
+        assert expectation_values_list[1].values[0] == -(1.0 + 1e-7)
+
     def test_calculate_exact_expectation_values_fails_with_non_simulator(
         self, estimation_tasks
     ):
@@ -161,6 +161,25 @@ class TestMeasurements:
             (1, 1, 1),
         ]
 
+    def test_intialize_with_array(self):
+        # Given
+        bitstrings = np.array([[0, 0, 1], [0, 1, 0], [1, 1, 1]], dtype=np.int8)
+
+        # When
+        measurements = Measurements.from_array(bitstrings)
+
+        # Then
+        assert measurements.bitstrings == [(0, 0, 1), (0, 1, 0), (1, 1, 1)]
+        assert all(
+            isinstance(bit, int)
+            for bitstring in measurements.bitstrings
+            for bit in bitstring
+        )
+
+    def test_intialize_with_array_fails_for_non_2d_array(self):
+        with pytest.raises(ValueError):
+            Measurements.from_array(np.array([0, 1, 1]))
+
     def test_bitstrings(self, measurements_data):
         input_filename = "measurements_input_test.json"
 
@@ -388,6 +407,29 @@ class TestMeasurements:
             expectation_values.estimator_covariances[0], target_covariances
         )
 
+    def test_get_expectation_values_for_more_than_64_qubits(self):
+        # Given
+        n_qubits = 70
+        first_bitstring = [0] * n_qubits
+        first_bitstring[3] = 1
+        first_bitstring[68] = 1
+        second_bitstring = [0] * n_qubits
+        second_bitstring[65] = 1
+        measurements = Measurements([tuple(first_bitstring), tuple(second_bitstring)])
+        ising_operator = (
+            PauliTerm("2*Z3*Z68") + PauliTerm("Z3*Z65") + PauliTerm("3*Z68*Z69")
+        )
+
+        # When
+        expectation_values = measurements.get_expectation_values(ising_operator)
+
+        # Then
+        np.testing.assert_allclose(expectation_values.values, [2, -1, 0])
+        np.testing.assert_allclose(
+            expectation_values.correlations[0],
+            [[4, -2, 0], [-2, 1, 0], [0, 0, 9]],
+        )
+
     @pytest.mark.parametrize(
         "bitstring_distribution, number_of_samples",
         [
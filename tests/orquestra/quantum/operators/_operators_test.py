@@ -83,6 +83,16 @@ class TestPauliTermInitialization:
         assert term.coefficient == coefficient
         assert term.qubits == frozenset(qubit_indices)
 
+    def test_terms_initialized_from_the_same_string_are_independent(self):
+        first_term = PauliTerm("1.5*X0*Z2")
+        second_term = PauliTerm("1.5*X0*Z2")
+
+        first_term._ops[3] = "Y"
+        first_term.coefficient = 2.0
+
+        assert second_term == PauliTerm({0: "X", 2: "Z"}, 1.5)
+        assert PauliTerm("1.5*X0*Z2") == second_term
+
     @pytest.mark.parametrize("coefficient", [2.0, -1, 0.1j, 2 - 3j, 2.1 + 3.7j])
     def test_coefficient_of_pauli_term_is_always_coerced_to_complex(self, coefficient):
         term = PauliTerm("X0", coefficient)
@@ -6,7 +6,12 @@ import unittest
 
 import numpy as np
 
-from orquestra.quantum.operators import PauliSum, PauliTerm, get_sparse_operator
+from orquestra.quantum.operators import (
+    PauliSum,
+    PauliTerm,
+    get_sparse_operator,
+    group_qwc,
+)
 from orquestra.quantum.utils import RNDSEED
 from orquestra.quantum.wavefunction import Wavefunction
 
@@ -134,3 +139,31 @@ class Testpaulioperator(unittest.TestCase):
         # Then
         self.assertAlmostEqual(-1, exp_op1)
         self.assertAlmostEqual(1, exp_op2)
+
+    def test_group_qwc(self):
+        # Given
+        operator = PauliSum("Z0*Z1 + 2*X0 + 0.5*X0*X1 + Z1 + Y2 + 3*I0")
+
+        # When
+        groups = group_qwc(operator)
+
+        # Then
+        self.assertEqual(
+            groups,
+            [
+                PauliSum("Z0*Z1 + Z1 + Y2 + 3*I0"),
+                PauliSum("2*X0 + 0.5*X0*X1"),
+            ],
+        )
+        self.assertEqual([term for term in groups[0]][0], PauliTerm("Z0*Z1"))
+
+    def test_group_qwc_puts_ising_operator_in_single_group(self):
+        # Given
+        operator = PauliSum("2*Z0 + 3*Z1*Z2 + Z0*Z2")
+
+        # When
+        groups = group_qwc(operator)
+
+        # Then
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(list(groups[0].terms), list(operator.terms))
@@ -246,7 +246,7 @@ class TestRepresentations:
 
 
 class TestGates:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def simulator(self) -> SymbolicSimulator:
         return SymbolicSimulator()
 